@@ -256,13 +256,11 @@ def half_sample_mode(x: np.ndarray) -> float:
     _corner_cases = (4, 3)  # for 4 samples and 3 samples
     while (ny := len(y)) >= _corner_cases[0]:
         half_y = ny // 2
-        w_min = y[-1] - y[0]
-        for i in range(ny - half_y):
-            w = y[i + half_y - 1] - y[i]
-            if w <= w_min:
-                w_min = w
-                j = i
-        if w == 0:
+        # widths of all windows of half_y samples, computed at once
+        w = y[half_y - 1 : ny - 1] - y[: ny - half_y]
+        # the last of the narrowest windows is taken
+        j = len(w) - 1 - np.argmin(w[::-1])
+        if w[-1] == 0:
             return y[j]
         y = y[j : (j + half_y - 1)]
     if len(y) == _corner_cases[1]:
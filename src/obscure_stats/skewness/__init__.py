@@ -1,6 +1,8 @@
 """Skewness module."""
 
 from .skewness import (
+    all_skews,
+    auc_and_wauc,
     auc_skew_gamma,
     bickel_mode_skew,
     bowley_skew,
@@ -11,12 +13,15 @@ from .skewness import (
     kelly_skew,
     l_skew,
     medeen_skew,
+    pearson_halfmode_skew,
     pearson_median_skew,
     pearson_mode_skew,
     wauc_skew_gamma,
 )
 
 __all__ = [
+    "all_skews",
+    "auc_and_wauc",
     "auc_skew_gamma",
     "bickel_mode_skew",
     "bowley_skew",
@@ -27,6 +32,7 @@ __all__ = [
     "kelly_skew",
     "l_skew",
     "medeen_skew",
+    "pearson_halfmode_skew",
     "pearson_median_skew",
     "pearson_mode_skew",
     "wauc_skew_gamma",
@@ -2,12 +2,124 @@
 
 from __future__ import annotations
 
+import functools
+
 import numpy as np
-from scipy import integrate, special, stats  # type: ignore[import-untyped]
 
 from obscure_stats.central_tendency import half_sample_mode
 
 
+def _compact_nan(x: np.ndarray) -> np.ndarray:
+    """Omit nans from the flattened array, without copying if there are none."""
+    x = np.ravel(x)
+    mask = np.isnan(x)
+    if not mask.any():
+        return x
+    return x[~mask]
+
+
+def _mean_std(x: np.ndarray) -> tuple[float, float]:
+    """Calculate mean and standard deviation, reusing the mean for the deviations."""
+    mean = x.mean()
+    # diff is a fresh array, so it can be squared in place;
+    # mean uses pairwise summation, which keeps float32 inputs precise
+    diff = x - mean
+    np.square(diff, out=diff)
+    return mean, np.sqrt(diff.mean())
+
+
+def _sorted_mode(y: np.ndarray) -> float:
+    """Calculate mode of the sorted array, i.e. start of the longest run."""
+    if y.size == 0:
+        return np.nan
+    starts = np.flatnonzero(np.concatenate(([True], y[1:] != y[:-1])))
+    counts = np.diff(starts, append=y.size)
+    return y[starts[np.argmax(counts)]]
+
+
+def _min_rank(y: np.ndarray, v: np.ndarray | float) -> np.ndarray | int:
+    """Calculate min-ranks (ties get the lowest rank) of values in the sorted array."""
+    return np.searchsorted(y, v, side="left") + 1
+
+
+@functools.lru_cache(maxsize=64)
+def _linear_ranks(
+    n: int, qs: tuple[float, ...], dtype: np.dtype
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Calculate ranks and weights of the linearly interpolated quantiles.
+
+    Weights keep the precision of floating point inputs (e.g. float32),
+    integer inputs are interpolated in float64.
+    Results are cached, since the same sample sizes and quantiles
+    are usually requested many times (e.g. in bootstrap).
+    """
+    pos = np.asarray(qs) * (n - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, n - 1)
+    frac = (pos - lo).astype(np.promote_types(dtype, np.float32))
+    for arr in (lo, hi, frac):
+        arr.flags.writeable = False
+    return lo, hi, frac
+
+
+def _sorted_quantiles(y: np.ndarray, qs: tuple[float, ...]) -> np.ndarray:
+    """Calculate quantiles (linear interpolation) of the sorted array."""
+    if y.size == 0:
+        return np.full(len(qs), np.nan)
+    lo, hi, frac = _linear_ranks(y.size, qs, y.dtype)
+    return y[lo] + (y[hi] - y[lo]) * frac
+
+
+def _quantiles_via_partition(x: np.ndarray, qs: tuple[float, ...]) -> np.ndarray:
+    """Calculate quantiles (linear interpolation) using partial sorting."""
+    if x.size == 0:
+        return np.full(len(qs), np.nan)
+    lo, hi, frac = _linear_ranks(x.size, qs, x.dtype)
+    y = np.partition(x, np.concatenate((lo, hi)))
+    return y[lo] + (y[hi] - y[lo]) * frac
+
+
+def _quantile_skew(low: float, mid: float, high: float) -> float:
+    """Calculate generalized Bowley skewness coefficient from quantiles."""
+    return (high + low - 2 * mid) / (high - low)
+
+
+def _groeneveld_skew(q1: float, q2: float, q3: float) -> float:
+    """Calculate Groeneveld's skewness coefficient from quartiles."""
+    num = q3 + q1 - 2 * q2
+    rs = num / (q2 - q1)
+    ls = num / (q3 - q2)
+    return rs if abs(rs) > abs(ls) else ls
+
+
+def _signed_deviation_mean(x: np.ndarray, center: float) -> float:
+    """Calculate mean sign of the deviations from the center."""
+    return (np.count_nonzero(x > center) - np.count_nonzero(x < center)) / x.size
+
+
+def _mean_and_absmean_dev(x: np.ndarray, center: float) -> tuple[float, float]:
+    """Calculate mean deviation and mean absolute deviation from the center."""
+    diff = x - center
+    mean_dev = diff.mean()
+    # diff is a fresh array, so absolute values can be taken in place
+    np.abs(diff, out=diff)
+    return mean_dev, diff.mean()
+
+
+def _l_skew(y: np.ndarray) -> float:
+    """Calculate standardized linear skewness of the sorted array."""
+    n = len(y)
+    if n == 0:
+        return np.nan
+    # binomial coefficients C(k, i) for i in (0, 1, 2)
+    k = np.arange(n)
+    combs = (np.ones(n), k, k * (k - 1) * 0.5)
+    betas = [np.sum(combs[i][i:] * y[i:]) / combs[i][-1] / n for i in range(3)]
+    l3 = 6 * betas[2] - 6 * betas[1] + betas[0]
+    l2 = 2 * betas[1] - betas[0]
+    return l3 / l2
+
+
 def l_skew(x: np.ndarray) -> float:
     """Calculate standardized linear skewness.
 
@@ -31,16 +143,7 @@ def l_skew(x: np.ndarray) -> float:
     using linear combinations of order statistics.
     Journal of the Royal Statistical Society, Series B. 52 (1): 105-124.
     """
-    n = len(x)
-    _x = np.sort(x)
-    common = 1 / special.comb(n - 1, (0, 1, 2)) / n
-    betas = [
-        common[i] * np.nansum(special.comb(np.arange(i, n), i) * _x[i:])
-        for i in range(3)
-    ]
-    l3 = 6 * betas[2] - 6 * betas[1] + betas[0]
-    l2 = 2 * betas[1] - betas[0]
-    return l3 / l2
+    return _l_skew(np.sort(_compact_nan(x)))
 
 
 def pearson_mode_skew(x: np.ndarray) -> float:
@@ -64,13 +167,48 @@ def pearson_mode_skew(x: np.ndarray) -> float:
     Biometrika Tables for Statisticians, vols. I and II.
     Cambridge University Press, Cambridge.
     """
-    mean = np.nanmean(x)
-    mode = stats.mode(x)[0]
-    std = np.nanstd(x)
+    y = np.sort(_compact_nan(x))
+    mean, std = _mean_std(y)
+    return (mean - _sorted_mode(y)) / std
+
+
+def pearson_halfmode_skew(x: np.ndarray, mode: float | None = None) -> float:
+    """Calculate Pearson's mode skew coefficient with half sample mode.
+
+    This measure should be more stable than Pearson mode skewness
+    coefficient, since it uses half sample mode instead of mode.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array.
+    mode : float, optional
+        Precomputed half sample mode of the input array.
+        If None, it is calculated from the input array.
+
+    Returns
+    -------
+    phmods : float
+        The value of Pearson's half-mode skew coefficient.
+
+    References
+    ----------
+    Pearson, E. S.; Hartley, H. O. (1966).
+    Biometrika Tables for Statisticians, vols. I and II.
+    Cambridge University Press, Cambridge.
+
+    Bickel, D. R. (2002).
+    Robust estimators of the mode and skewness of continuous data.
+    Computational Statistics & Data Analysis, Elsevier, 39(2), 153-163.
+    """
+    x = _compact_nan(x)
+    if mode is None:
+        mode = half_sample_mode(x)
+    mean, std = _mean_std(x)
     return (mean - mode) / std
 
 
-def bickel_mode_skew(x: np.ndarray) -> float:
+def bickel_mode_skew(x: np.ndarray, mode: float | None = None) -> float:
     """Calculate Robust Mode skew with half sample mode.
 
     This measure should be more stable than Pearson mode
@@ -80,6 +218,9 @@ def bickel_mode_skew(x: np.ndarray) -> float:
     ----------
     x : array_like
         Input array.
+    mode : float, optional
+        Precomputed half sample mode of the input array.
+        If None, it is calculated from the input array.
 
     Returns
     -------
@@ -92,8 +233,10 @@ def bickel_mode_skew(x: np.ndarray) -> float:
     Robust estimators of the mode and skewness of continuous data.
     Computational Statistics & Data Analysis, Elsevier, 39(2), 153-163.
     """
-    mode = half_sample_mode(x)
-    return np.nanmean(np.sign(x - mode))
+    x = _compact_nan(x)
+    if mode is None:
+        mode = half_sample_mode(x)
+    return _signed_deviation_mean(x, mode)
 
 
 def pearson_median_skew(x: np.ndarray) -> float:
@@ -115,9 +258,9 @@ def pearson_median_skew(x: np.ndarray) -> float:
     Biometrika Tables for Statisticians, vols. I and II.
     Cambridge University Press, Cambridge.
     """
-    mean = np.nanmean(x)
-    median = np.nanmedian(x)
-    std = np.nanstd(x)
+    x = _compact_nan(x)
+    mean, std = _mean_std(x)
+    median = _quantiles_via_partition(x, (0.5,))[0]
     return 3 * (mean - median) / std
 
 
@@ -144,9 +287,11 @@ def medeen_skew(x: np.ndarray) -> float:
     Measuring Skewness and Kurtosis.
     The Statistician. 33 (4): 391-399.
     """
-    median = np.nanmedian(x)
-    mean = np.nanmean(x)
-    return (mean - median) / np.nanmean(np.abs(x - median))
+    x = _compact_nan(x)
+    median = _quantiles_via_partition(x, (0.5,))[0]
+    # mean - median is the same as the mean deviation from the median
+    mean_dev, absmean_dev = _mean_and_absmean_dev(x, median)
+    return mean_dev / absmean_dev
 
 
 def bowley_skew(x: np.ndarray) -> float:
@@ -173,8 +318,8 @@ def bowley_skew(x: np.ndarray) -> float:
     Elements of Statistics.
     P.S. King and Son, London.
     """
-    q1, q2, q3 = np.nanquantile(x, [0.25, 0.5, 0.75])
-    return (q3 + q1 - 2 * q2) / (q3 - q1)
+    q1, q2, q3 = _quantiles_via_partition(_compact_nan(x), (0.25, 0.5, 0.75))
+    return _quantile_skew(q1, q2, q3)
 
 
 def groeneveld_skew(x: np.ndarray) -> float:
@@ -201,10 +346,8 @@ def groeneveld_skew(x: np.ndarray) -> float:
     Measuring Skewness and Kurtosis.
     The Statistician. 33 (4): 391-399.
     """
-    q1, q2, q3 = np.nanquantile(x, [0.25, 0.5, 0.75])
-    rs = (q3 + q1 - 2 * q2) / (q2 - q1)
-    ls = (q3 + q1 - 2 * q2) / (q3 - q2)
-    return rs if abs(rs) > abs(ls) else ls
+    q1, q2, q3 = _quantiles_via_partition(_compact_nan(x), (0.25, 0.5, 0.75))
+    return _groeneveld_skew(q1, q2, q3)
 
 
 def kelly_skew(x: np.ndarray) -> float:
@@ -231,8 +374,8 @@ def kelly_skew(x: np.ndarray) -> float:
     Some tests of significance with ordered variables.
     J. R. Stat. Soc. Ser. B Stat. Methodol. 18, 1-31.
     """
-    d1, d5, d9 = np.nanquantile(x, [0.1, 0.5, 0.9])
-    return (d9 + d1 - 2 * d5) / (d9 - d1)
+    d1, d5, d9 = _quantiles_via_partition(_compact_nan(x), (0.1, 0.5, 0.9))
+    return _quantile_skew(d1, d5, d9)
 
 
 def hossain_adnan_skew(x: np.ndarray) -> float:
@@ -258,8 +401,25 @@ def hossain_adnan_skew(x: np.ndarray) -> float:
     A New Approach to Determine the Asymmetry of a Distribution.
     Journal of Applied St atistical Science, Vol.15, pp. 127-134.
     """
-    diff = x - np.nanmedian(x)
-    return np.nanmean(diff) / np.nanmean(np.abs(diff))
+    x = _compact_nan(x)
+    median = _quantiles_via_partition(x, (0.5,))[0]
+    mean_dev, absmean_dev = _mean_and_absmean_dev(x, median)
+    return mean_dev / absmean_dev
+
+
+def _rank_skew(y: np.ndarray) -> float:
+    """Calculate Forhad-Shorna coefficient of rank skewness of the sorted array."""
+    if y.size == 0:
+        return np.nan
+    mr = (y[0] + y[-1]) * 0.5
+    if np.isnan(mr):
+        # midrange of a sample with both infinities is undefined
+        return np.nan
+    # min-ranks within the sample extended with the midrange
+    rank_mr = _min_rank(y, mr)
+    ranks = _min_rank(y, y) + (y > mr)
+    diff = rank_mr - ranks
+    return diff.sum() / np.abs(diff).sum()
 
 
 def forhad_shorna_rank_skew(x: np.ndarray) -> float:
@@ -286,25 +446,55 @@ def forhad_shorna_rank_skew(x: np.ndarray) -> float:
     An Alternative Form of Boxplot.
     arXiv preprint arXiv:1908.06400.
     """
-    mr = (np.nanmin(x) + np.nanmax(x)) * 0.5
-    arr = np.r_[x, mr]
-    arr_ranked = stats.rankdata(arr, method="min", nan_policy="omit")
-    diff = arr_ranked[-1] - arr_ranked
-    diff = diff[:-1]
-    return np.nansum(diff) / np.nansum(np.abs(diff))
+    return _rank_skew(np.sort(_compact_nan(x)))
 
 
-def _auc_skew_gamma(x: np.ndarray, dp: float, w: np.ndarray | float) -> float:
-    """Calculate AUC skew."""
+def _auc_skew_gamma(y: np.ndarray, dp: float) -> tuple[float, float]:
+    """Calculate unweighted and weighted AUC skew of the sorted array."""
     n = int(1 / dp)
     half_n = n // 2
-    qs = np.nanquantile(x, np.r_[np.linspace(0, 1, n), 0.5])
+    # all quantiles and the median (last one) are read in one lookup
+    qs = _sorted_quantiles(y, _auc_probabilities(n))
     med = qs[-1]
-    qs = qs[:-1]
     qs_low = qs[:half_n]
-    qs_high = qs[-half_n:]
-    skews = (qs_low + qs_high - 2 * med) / (qs_high - qs_low) * w
-    return integrate.trapezoid(skews, dx=dp)
+    qs_high = qs[-half_n - 1 : -1]
+    # generalized Bowley skewness coefficients computed in one buffer
+    skews = np.add(qs_low, qs_high)
+    skews -= 2 * med
+    skews /= qs_high - qs_low
+    auc, wauc = _auc_weights(dp, skews.dtype) @ skews
+    return auc, wauc
+
+
+@functools.lru_cache(maxsize=16)
+def _auc_probabilities(n: int) -> tuple[float, ...]:
+    """Calculate probabilities of the quantiles used in AUC skew."""
+    return (*np.linspace(0, 1, n).tolist(), 0.5)
+
+
+@functools.lru_cache(maxsize=16)
+def _auc_weights(dp: float, dtype: np.dtype) -> np.ndarray:
+    """Calculate trapezoidal rule weights of the unweighted and weighted AUC skew.
+
+    Step of the integration and reweighting of the coefficients
+    are folded into the weights.
+    """
+    half_n = int(1 / dp) // 2
+    w = np.full(half_n, dp)
+    w[0] -= dp * 0.5
+    w[-1] -= dp * 0.5
+    w = np.stack((w, w * _wauc_weights(dp))).astype(dtype)
+    w.flags.writeable = False
+    return w
+
+
+@functools.lru_cache(maxsize=16)
+def _wauc_weights(dp: float) -> np.ndarray:
+    """Calculate weights of the generalized Bowley skewness coefficients."""
+    half_n = int(1 / dp) // 2
+    w = (np.arange(half_n) / half_n)[::-1].copy()
+    w.flags.writeable = False
+    return w
 
 
 def auc_skew_gamma(x: np.ndarray, dp: float = 0.01) -> float:
@@ -331,8 +521,7 @@ def auc_skew_gamma(x: np.ndarray, dp: float = 0.01) -> float:
     Mean skewness measures.
     arXiv preprint arXiv:1912.06996.
     """
-    w = 1.0
-    return _auc_skew_gamma(x, dp, w)
+    return _auc_skew_gamma(np.sort(_compact_nan(x)), dp)[0]
 
 
 def wauc_skew_gamma(x: np.ndarray, dp: float = 0.01) -> float:
@@ -360,10 +549,50 @@ def wauc_skew_gamma(x: np.ndarray, dp: float = 0.01) -> float:
     Mean skewness measures.
     arXiv preprint arXiv:1912.06996.
     """
-    n = int(1 / dp)
-    half_n = n // 2
-    w = (np.arange(half_n) / half_n)[::-1]
-    return _auc_skew_gamma(x, dp, w)
+    return _auc_skew_gamma(np.sort(_compact_nan(x)), dp)[1]
+
+
+def auc_and_wauc(x: np.ndarray, dp: float = 0.01) -> tuple[float, float]:
+    """Calculate unweighted and weighted AUC skew at once.
+
+    The sample is sorted and the generalized Bowley skewness coefficients
+    are calculated only once, which is faster than calling
+    auc_skew_gamma and wauc_skew_gamma separately.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array.
+    dp : float, default = 0.01
+        Step used in calculating area under the curve (integrating).
+
+    Returns
+    -------
+    aucbs : float
+        The value of AUC Bowley skewness.
+    waucbs : float
+        The value of weighted AUC Bowley skewness.
+
+    See Also
+    --------
+    auc_skew_gamma - Area under the curve of generalized Bowley skewness.
+    wauc_skew_gamma - Weighted area under the curve of generalized Bowley skewness.
+    """
+    return _auc_skew_gamma(np.sort(_compact_nan(x)), dp)
+
+
+def _cumulative_skew(y: np.ndarray) -> float:
+    """Calculate cumulative measure of skewness of the sorted array."""
+    n = len(y)
+    if n == 0:
+        return np.nan
+    p = np.cumsum(y)
+    p = p / p[-1]
+    r = np.arange(n)
+    q = r / n
+    d = q - p
+    w = (2 * r - n) * 3 / n
+    return np.sum(d * w) / np.sum(d)
 
 
 def cumulative_skew(x: np.ndarray) -> float:
@@ -388,11 +617,51 @@ def cumulative_skew(x: np.ndarray) -> float:
     A robust measure of skewness using cumulative statistic calculation.
     arXiv preprint arXiv:2209.10699.
     """
-    n = len(x)
-    p = np.nancumsum(np.sort(x))
-    p = p / p[-1]
-    r = np.arange(n)
-    q = r / n
-    d = q - p
-    w = (2 * r - n) * 3 / n
-    return np.sum(d * w) / np.sum(d)
+    return _cumulative_skew(np.sort(_compact_nan(x)))
+
+
+def all_skews(x: np.ndarray, dp: float = 0.01) -> dict[str, float]:
+    """Calculate all measures of skewness at once.
+
+    The sample is sorted only once and the shared statistics (mean,
+    standard deviation, quantiles, modes) are calculated only once,
+    which is faster than calling every function separately.
+    Only the half sample mode estimator sorts the (already sorted)
+    sample again.
+    Nans are omitted.
+
+    Parameters
+    ----------
+    x : array_like
+        Input array.
+    dp : float, default = 0.01
+        Step used in calculating area under the curve (integrating).
+
+    Returns
+    -------
+    skews : dict
+        Mapping from the name of the skewness function to its value.
+    """
+    y = np.sort(_compact_nan(x))
+    mean, std = _mean_std(y)
+    d1, q1, q2, q3, d9 = _sorted_quantiles(y, (0.1, 0.25, 0.5, 0.75, 0.9))
+    mean_dev, absmean_dev = _mean_and_absmean_dev(y, q2)
+    mode = _sorted_mode(y)
+    hsm = half_sample_mode(y)
+    auc, wauc = _auc_skew_gamma(y, dp)
+    return {
+        "auc_skew_gamma": auc,
+        "bickel_mode_skew": _signed_deviation_mean(y, hsm),
+        "bowley_skew": _quantile_skew(q1, q2, q3),
+        "cumulative_skew": _cumulative_skew(y),
+        "forhad_shorna_rank_skew": _rank_skew(y),
+        "groeneveld_skew": _groeneveld_skew(q1, q2, q3),
+        "hossain_adnan_skew": mean_dev / absmean_dev,
+        "kelly_skew": _quantile_skew(d1, q2, d9),
+        "l_skew": _l_skew(y),
+        "medeen_skew": mean_dev / absmean_dev,
+        "pearson_halfmode_skew": (mean - hsm) / std,
+        "pearson_median_skew": 3 * (mean - q2) / std,
+        "pearson_mode_skew": (mean - mode) / std,
+        "wauc_skew_gamma": wauc,
+    }
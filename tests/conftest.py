@@ -38,6 +38,12 @@ def x_array_nan(x_array_float: np.ndarray) -> np.ndarray:
     return temp
 
 
+@pytest.fixture(scope="session")
+def x_array_all_nan(x_array_float: np.ndarray) -> np.ndarray:
+    """Array of nans."""
+    return np.full_like(x_array_float, np.nan)
+
+
 @pytest.fixture(scope="session")
 def y_list_float() -> list[float]:
     """List of floats."""
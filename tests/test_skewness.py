@@ -1,10 +1,15 @@
 """Collection of tests of skewness module."""
 
+from __future__ import annotations
+
 import typing
 
 import numpy as np
 import pytest
+from obscure_stats.central_tendency import half_sample_mode
 from obscure_stats.skewness import (
+    all_skews,
+    auc_and_wauc,
     auc_skew_gamma,
     bickel_mode_skew,
     bowley_skew,
@@ -15,6 +20,7 @@ from obscure_stats.skewness import (
     kelly_skew,
     l_skew,
     medeen_skew,
+    pearson_halfmode_skew,
     pearson_median_skew,
     pearson_mode_skew,
     wauc_skew_gamma,
@@ -31,6 +37,7 @@ all_functions = [
     kelly_skew,
     l_skew,
     medeen_skew,
+    pearson_halfmode_skew,
     pearson_median_skew,
     pearson_mode_skew,
     wauc_skew_gamma,
@@ -96,3 +103,193 @@ def test_statistic_with_nans(
     if np.isnan(func(x_array_nan)):
         msg = "Statistic should not return nans."
         raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "func",
+    all_functions,
+)
+def test_statistic_with_all_nans(
+    func: typing.Callable,
+    x_array_all_nan: np.ndarray,
+) -> None:
+    """Test that array of nans gives nan."""
+    with np.errstate(all="ignore"):
+        res = func(x_array_all_nan)
+    if not np.isnan(res):
+        msg = "Statistic should return nan for array of nans."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "func",
+    all_functions,
+)
+def test_nans_are_omitted(
+    func: typing.Callable,
+    x_array_nan: np.ndarray,
+) -> None:
+    """Test that nans are omitted from the calculation."""
+    if func(x_array_nan) != pytest.approx(func(x_array_nan[~np.isnan(x_array_nan)])):
+        msg = "Nans should be omitted."
+        raise ValueError(msg)
+
+
+def _groeneveld_reference(x: np.ndarray) -> float:
+    """Groeneveld's skewness coefficient from numpy quantiles."""
+    q1, q2, q3 = np.nanquantile(x, [0.25, 0.5, 0.75])
+    rs = (q3 + q1 - 2 * q2) / (q2 - q1)
+    ls = (q3 + q1 - 2 * q2) / (q3 - q2)
+    return rs if abs(rs) > abs(ls) else ls
+
+
+quantile_references = [
+    (
+        bowley_skew,
+        lambda x: (
+            (np.nanquantile(x, 0.75) + np.nanquantile(x, 0.25) - 2 * np.nanmedian(x))
+            / (np.nanquantile(x, 0.75) - np.nanquantile(x, 0.25))
+        ),
+    ),
+    (
+        kelly_skew,
+        lambda x: (
+            (np.nanquantile(x, 0.9) + np.nanquantile(x, 0.1) - 2 * np.nanmedian(x))
+            / (np.nanquantile(x, 0.9) - np.nanquantile(x, 0.1))
+        ),
+    ),
+    (groeneveld_skew, _groeneveld_reference),
+    (
+        pearson_median_skew,
+        lambda x: 3 * (np.nanmean(x) - np.nanmedian(x)) / np.nanstd(x),
+    ),
+]
+
+
+@pytest.mark.parametrize(("func", "reference"), quantile_references)
+@pytest.mark.parametrize(
+    "data",
+    ["x_array_float", "x_array_int", "x_array_nan", "hls_test_data"],
+)
+@pytest.mark.parametrize("size", [None, 100, 101])
+def test_quantiles_match_numpy(
+    func: typing.Callable,
+    reference: typing.Callable,
+    data: str,
+    size: int | None,
+    request: pytest.FixtureRequest,
+) -> None:
+    """Test that quantile based statistics match numpy quantiles."""
+    x = np.asarray(request.getfixturevalue(data), dtype="float")
+    if size is not None:
+        # bigger samples of odd and even size with ties and nans
+        x = np.random.default_rng(size).choice(x, size=size)
+    if func(x) != pytest.approx(reference(x), rel=1e-9):
+        msg = f"Results of {func.__name__} and numpy quantiles do not match."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "func",
+    all_functions,
+)
+@pytest.mark.parametrize("with_nan", [False, True])
+def test_multidimensional_input(func: typing.Callable, *, with_nan: bool) -> None:
+    """Test that multidimensional arrays are flattened with or without nans."""
+    x = np.arange(12.0).reshape(3, 4) ** 2
+    if with_nan:
+        x[1, 1] = np.nan
+    if func(x) != pytest.approx(func(x.ravel())):
+        msg = "Multidimensional input should be flattened."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("seed", [1, 42, 99])
+def test_all_skews(seed: int) -> None:
+    """Test that batch calculation matches separate calculations."""
+    rng = np.random.default_rng(seed)
+    x = np.round(rng.exponential(size=100), 2)
+    res = all_skews(x)
+    for func in all_functions:
+        if res[func.__name__] != pytest.approx(func(x)):
+            msg = f"Results of all_skews and {func.__name__} do not match."
+            raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [bickel_mode_skew, pearson_halfmode_skew],
+)
+def test_precomputed_mode(func: typing.Callable, x_array_float: np.ndarray) -> None:
+    """Test that precomputed half sample mode gives the same result."""
+    mode = half_sample_mode(x_array_float)
+    if func(x_array_float, mode=mode) != pytest.approx(func(x_array_float)):
+        msg = "Results with precomputed and calculated mode do not match."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    "func",
+    [
+        auc_skew_gamma,
+        bowley_skew,
+        groeneveld_skew,
+        hossain_adnan_skew,
+        kelly_skew,
+        medeen_skew,
+        pearson_median_skew,
+    ],
+)
+def test_float32_precision(func: typing.Callable, x_array_float: np.ndarray) -> None:
+    """Test that float32 inputs are not upcasted."""
+    if func(x_array_float.astype(np.float32)).dtype != np.float32:
+        msg = "Statistic should keep float32 precision."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize("dp", [0.01, 0.05])
+def test_auc_and_wauc(dp: float, x_array_float: np.ndarray) -> None:
+    """Test that joint calculation matches separate calculations."""
+    auc, wauc = auc_and_wauc(x_array_float, dp=dp)
+    if auc != pytest.approx(auc_skew_gamma(x_array_float, dp=dp)) or (
+        wauc != pytest.approx(wauc_skew_gamma(x_array_float, dp=dp))
+    ):
+        msg = "Results of auc_and_wauc and separate functions do not match."
+        raise ValueError(msg)
+
+
+def test_float32_large_sample_accuracy() -> None:
+    """Test that moments of big float32 samples do not lose precision."""
+    rng = np.random.default_rng(0)
+    x = rng.lognormal(size=2_000_000).astype(np.float32)
+    if pearson_median_skew(x) != pytest.approx(
+        pearson_median_skew(x.astype(np.float64)), rel=6e-7
+    ):
+        msg = "Float32 result deviates from float64 result."
+        raise ValueError(msg)
+
+
+@pytest.mark.parametrize(
+    ("x", "expected"),
+    [
+        ((-np.inf, 1.0, 2.0, np.inf), np.nan),
+        ((1.0, 2.0, 3.0, np.inf), 1.0),
+        ((-np.inf, 1.0, 2.0, 3.0), -1.0),
+    ],
+)
+def test_rank_skew_infinite_midrange(x: tuple[float, ...], expected: float) -> None:
+    """Test Rank skewness coefficient with infinite midrange."""
+    with np.errstate(invalid="ignore"):
+        res = forhad_shorna_rank_skew(np.asarray(x))
+    if res != pytest.approx(expected, nan_ok=True):
+        msg = f"Expected {expected}, got {res}."
+        raise ValueError(msg)
+
+
+def test_all_skews_with_all_nans(x_array_all_nan: np.ndarray) -> None:
+    """Test that array of nans gives nans in batch calculation."""
+    with np.errstate(all="ignore"):
+        res = all_skews(x_array_all_nan)
+    if not all(np.isnan(v) for v in res.values()):
+        msg = "All statistics should return nan for array of nans."
+        raise ValueError(msg)